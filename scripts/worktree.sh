@@ -11,9 +11,6 @@ set -e  # エラー時即座に終了
 COMMAND=${1}
 WORKTREE_BASE_DIR="./worktrees"
 
-# 現在のブランチを記憶
-ORIGINAL_BRANCH=$(git rev-parse --abbrev-ref HEAD)
-
 # ヘルプ表示
 show_help() {
     echo "Git Worktree管理スクリプト (Claude Code対応)"
@@ -43,8 +40,11 @@ worktree_new() {
         exit 1
     fi
     
+    # 現在のブランチを記憶（new 以外のコマンドでは不要なため、ここで初めて取得する）
+    ORIGINAL_BRANCH=$(git rev-parse --abbrev-ref HEAD)
+    
     # ブランチ名をフォルダ名として使用（スラッシュをハイフンに変換）
-    FOLDER_NAME=$(echo "$NEW_BRANCH_NAME" | sed 's/\//-/g')
+    FOLDER_NAME="${NEW_BRANCH_NAME//\//-}"
     
     echo "🌱 Creating new branch and worktree..."
     echo "   📍 Original branch: $ORIGINAL_BRANCH"
@@ -52,29 +52,23 @@ worktree_new() {
     echo "   📁 Folder: $WORKTREE_BASE_DIR/$FOLDER_NAME"
     echo ""
     
-    # 元のブランチに確実に戻る
-    echo "🔄 Ensuring we're on the original branch: $ORIGINAL_BRANCH"
-    git checkout "$ORIGINAL_BRANCH"
-    
-    # 新ブランチを作成（現在のブランチから分岐）
-    echo "🌱 Creating new branch: $NEW_BRANCH_NAME"
-    git checkout -b "$NEW_BRANCH_NAME"
-    
-    # 元のブランチに戻る
-    echo "🔄 Returning to original branch: $ORIGINAL_BRANCH"
-    git checkout "$ORIGINAL_BRANCH"
-    
     # worktreesディレクトリ作成
     mkdir -p "$WORKTREE_BASE_DIR"
     
-    # worktree作成（新ブランチを指定）
-    echo "🌿 Creating worktree: $WORKTREE_BASE_DIR/$FOLDER_NAME -> $NEW_BRANCH_NAME"
-    git worktree add "$WORKTREE_BASE_DIR/$FOLDER_NAME" "$NEW_BRANCH_NAME"
+    # 新ブランチ作成＋worktree作成（元のブランチから分岐）
+    # checkoutを往復せず1回のgit呼び出しで行うため、元の作業ツリーには触れない
+    echo "🌿 Creating worktree: $WORKTREE_BASE_DIR/$FOLDER_NAME -> $NEW_BRANCH_NAME (from $ORIGINAL_BRANCH)"
+    git worktree add -b "$NEW_BRANCH_NAME" "$WORKTREE_BASE_DIR/$FOLDER_NAME" "$ORIGINAL_BRANCH"
     
     # 環境ファイルコピー
     echo "📄 Copying environment files..."
     for file in .env.local .env.development .env.production .env; do
         if [ -f "$file" ]; then
+            # post-checkoutフック（LINK_ENV_FILES=true）でハードリンク済みの場合、cp は同一ファイルとして失敗するためスキップ
+            if [ "$file" -ef "$WORKTREE_BASE_DIR/$FOLDER_NAME/$file" ]; then
+                echo "   🔗 Already linked: $file"
+                continue
+            fi
             cp "$file" "$WORKTREE_BASE_DIR/$FOLDER_NAME/"
             echo "   ✅ Copied: $file"
         fi
@@ -103,7 +97,7 @@ worktree_add() {
     fi
     
     # ブランチ名をフォルダ名として使用（スラッシュをハイフンに変換）
-    FOLDER_NAME=$(echo "$BRANCH_NAME" | sed 's/\//-/g')
+    FOLDER_NAME="${BRANCH_NAME//\//-}"
     
     # worktreesディレクトリ作成
     mkdir -p "$WORKTREE_BASE_DIR"
@@ -116,6 +110,11 @@ worktree_add() {
     echo "📄 Copying environment files..."
     for file in .env.local .env.development .env.production .env; do
         if [ -f "$file" ]; then
+            # post-checkoutフック（LINK_ENV_FILES=true）でハードリンク済みの場合、cp は同一ファイルとして失敗するためスキップ
+            if [ "$file" -ef "$WORKTREE_BASE_DIR/$FOLDER_NAME/$file" ]; then
+                echo "   🔗 Already linked: $file"
+                continue
+            fi
             cp "$file" "$WORKTREE_BASE_DIR/$FOLDER_NAME/"
             echo "   ✅ Copied: $file"
         fi
@@ -149,7 +148,7 @@ worktree_remove() {
     fi
     
     # ブランチ名をフォルダ名として使用（スラッシュをハイフンに変換）
-    FOLDER_NAME=$(echo "$BRANCH_NAME" | sed 's/\//-/g')
+    FOLDER_NAME="${BRANCH_NAME//\//-}"
     
     echo "🗑️  Removing worktree: $WORKTREE_BASE_DIR/$FOLDER_NAME (branch: $BRANCH_NAME)"
     git worktree remove "$WORKTREE_BASE_DIR/$FOLDER_NAME"